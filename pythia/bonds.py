@@ -6,7 +6,7 @@ nearest-neighbor bonds, with few additional transformations.
 import numpy as np
 import freud
 
-from .internal import cite
+from .internal import as_freud_box, cite
 
 
 def _nlist_nn_helper(fbox, positions, neighbors, rmax_guess, exclude_ii=True):
@@ -25,7 +25,7 @@ def normalized_radial_distance(box, positions, neighbors, rmax_guess=2.):
     """Returns the ratio of the euclidean distance of each near-neighbor
     to that of the nearest neighbor for each particle.
     """
-    fbox = freud.box.Box.from_box(box)
+    fbox = as_freud_box(box)
 
     neighbors = _nlist_nn_helper(fbox, positions, neighbors, rmax_guess, True)
 
@@ -45,7 +45,7 @@ def _get_neighborhood_distance_matrix(box, positions, neighbors, rmax_guess=2.):
     """Construct a matrix of pairwise distances between `r_j - r_i` and `r_k - r_i`
     for all neighbors j and k of each particle i.
     """
-    fbox = freud.box.Box.from_box(box)
+    fbox = as_freud_box(box)
 
     neighbors = _nlist_nn_helper(fbox, positions, neighbors, rmax_guess, True)
 
@@ -108,7 +108,7 @@ def _get_neighborhood_angle_matrix(box, positions, neighbors, rmax_guess=2.):
     """Construct a matrix of pairwise angles between `r_j - r_i` and `r_k - r_i`
     for all neighbors j and k of each particle i.
     """
-    fbox = freud.box.Box.from_box(box)
+    fbox = as_freud_box(box)
 
     neighbors = _nlist_nn_helper(fbox, positions, neighbors, rmax_guess, True)
 
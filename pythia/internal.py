@@ -4,6 +4,8 @@ import inspect
 import logging
 import textwrap
 
+import freud
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +16,13 @@ def assert_installed(name):
         raise ImportError("{} required for requested functionality.".format(name))
 
 
+def as_freud_box(box):
+    """Convert `box` to a freud Box, returning it unchanged if it is one already"""
+    if isinstance(box, freud.box.Box):
+        return box
+    return freud.box.Box.from_box(box)
+
+
 all_citations = {}
 
 all_citations['kondor2007'] = """
@@ -3,13 +3,17 @@ This module computes descriptors based on combinations of
 spherical harmonics applied to nearest-neighbor bonds.
 """
 
-from collections import defaultdict
+import concurrent.futures
+import contextlib
+import functools
 import itertools
 import logging
+import math
+import os
 import numpy as np
 import freud
 
-from .internal import assert_installed, cite
+from .internal import as_freud_box, assert_installed, cite
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,7 @@ def _nlist_helper(fbox, positions, neighbors, exclude_ii=None):
     if isinstance(neighbors, int):
         aq = freud.AABBQuery(fbox, positions)
         result = aq.query(positions, {'num_neighbors': neighbors, 'exclude_ii': exclude_ii})
-        neighbors = result.toNeighborList()
+        neighbors = result.toNeighborList(sort_by_distance=True)
     elif isinstance(neighbors, float):
         aq = freud.AABBQuery(fbox, positions)
         result = aq.query(positions, {'r_max': neighbors, 'exclude_ii': exclude_ii})
@@ -27,6 +31,41 @@ def _nlist_helper(fbox, positions, neighbors, exclude_ii=None):
     return neighbors
 
 
+@contextlib.contextmanager
+def _parallel_map(executor_class, max_workers):
+    """Provide a map function running on a concurrent.futures executor
+    of the given class, or the builtin map if only one worker would
+    be used (avoiding the overhead of starting workers)."""
+    if max_workers > 1:
+        with executor_class(max_workers) as executor:
+            yield executor.map
+    else:
+        yield map
+
+
+def _max_workers(num_tasks, num_threads=None):
+    """Number of workers to use for `num_tasks` independent tasks: at
+    most `num_threads`, or the number of CPUs this process is allowed
+    to run on (respecting affinity masks set by e.g. taskset or SLURM)
+    if `num_threads` is None."""
+    if num_threads is None:
+        try:
+            num_threads = len(os.sched_getaffinity(0))
+        except AttributeError:
+            # sched_getaffinity is not available on all platforms
+            num_threads = os.cpu_count() or 1
+    return max(1, min(num_tasks, num_threads))
+
+
+def _noisy_neighbor_average(seed, box, positions, noise_magnitude, args):
+    """Compute a single noisy sample for neighbor_average. `args` holds
+    the remaining positional arguments of neighbor_average."""
+    noise = np.random.RandomState(seed).normal(0, noise_magnitude, positions.shape)
+    noisy_positions = positions + noise
+    noisy_positions = box.wrap(noisy_positions)
+    return neighbor_average(box, noisy_positions, *args)
+
+
 @cite('freud2016', 'spellings2018')
 def neighbor_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
                      negative_m=True, reference_frame='neighborhood',
@@ -40,29 +79,43 @@ def neighbor_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
     :param neigh_max: Maximum number of neighbor environment sizes to consider (inclusive)
     :param lmax: Maximum spherical harmonic degree l
     :param negative_m: Include negative m spherical harmonics in the output array?
-    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate
+    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate. The 'neighborhood' frame is fitted to all bonds of each particle in the neighbor list (its `neigh_max` nearest bonds unless `nlist` is given) and shared by every environment size, so smaller sizes differ from computing them alone.
     :param orientations: Per-particle orientations, only used when reference_frame == 'particle_local'
     :param rmax_guess: Initial guess of the distance to find `neigh_max` nearest neighbors. Only affects algorithm speed.
     :param noise_samples: Number of random noisy samples of positions to average the result over (disabled if 0)
     :param noise_magnitude: Magnitude of (normally-distributed) noise to apply to noise_samples different positions (disabled if `noise_samples == 0`)
-    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`)
+    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`). Each environment size averages over the first bonds of each particle in the list, so it should be sorted by distance.
     """  # noqa E501
-    freud_box = freud.box.Box.from_box(box)
+    freud_box = as_freud_box(box)
 
     if noise_samples:
-        accumulation = 0
-        for _ in range(noise_samples):
-            noise = np.random.normal(0, noise_magnitude, positions.shape)
-            noisy_positions = positions + noise
-            freud_box.wrap(noisy_positions)
-            noisy_descriptors = neighbor_average(
-                box, noisy_positions, neigh_min, neigh_max, lmax, negative_m,
-                reference_frame, orientations, rmax_guess, 0, 0)
-
-            accumulation += noisy_descriptors
+        # samples are independent, so compute them in separate
+        # threads (if more than one CPU is available; freud releases
+        # the GIL) and reduce them as they arrive. Worker processes
+        # are not used: forked workers hang once numba's TBB thread
+        # pool has started, and other start methods would require
+        # callers to guard their scripts with `if __name__ == '__main__'`
+        seeds = np.random.randint(2**31, size=noise_samples)
+        args = (neigh_min, neigh_max, lmax, negative_m, reference_frame,
+                orientations, rmax_guess, 0, 0)
+        max_workers = _max_workers(noise_samples)
+
+        # running sum over samples, kept in double precision so that
+        # large numbers of samples do not lose accuracy
+        accumulation = None
+        with _parallel_map(concurrent.futures.ThreadPoolExecutor, max_workers) as map_samples:
+            samples = map_samples(
+                _noisy_neighbor_average, seeds, itertools.repeat(freud_box),
+                itertools.repeat(positions), itertools.repeat(noise_magnitude),
+                itertools.repeat(args))
+
+            for noisy_descriptors in samples:
+                if accumulation is None:
+                    accumulation = np.zeros(noisy_descriptors.shape, dtype=np.complex128)
+                accumulation += noisy_descriptors
 
         accumulation /= noise_samples
-        return accumulation
+        return accumulation.astype(noisy_descriptors.dtype)
 
     if orientations is None and reference_frame == 'particle_local':
         logger.error('reference_frame="particle_local" was given for '
@@ -70,7 +123,6 @@ def neighbor_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
         orientations = np.zeros((positions.shape[0], 4), dtype=np.float32)
         orientations[:, 0] = 1
 
-    result = []
     comp = freud.environment.LocalDescriptors(
         l_max=lmax, negative_m=negative_m, mode=reference_frame)
 
@@ -82,17 +134,28 @@ def neighbor_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
         indices = np.where(neighbor_counts < neigh_max)[0]
         logger.warning('{} particles have too few neighbors'.format(len(indices)))
 
-    for nNeigh in range(neigh_min, neigh_max + 1):
-        # sphs::(Nbond, Nsph)
-        comp.compute((freud_box, positions), orientations=orientations, neighbors=nlist)
-        sphs = comp.sph
+    # sphs::(Nbond, Nsph)
+    comp.compute((freud_box, positions), orientations=orientations, neighbors=nlist)
+    sphs = comp.sph
+
+    # bond_sums[segments[i] + k] - bond_sums[segments[i]] is the sum
+    # over the first k bonds of particle i
+    bond_sums = np.zeros((sphs.shape[0] + 1, sphs.shape[1]), dtype=np.complex128)
+    np.cumsum(sphs, axis=0, out=bond_sums[1:])
+
+    Nsph = sphs.shape[1]
+    result = np.empty((positions.shape[0], (neigh_max - neigh_min + 1)*Nsph),
+                      dtype=sphs.dtype)
 
-        # average over neighbors
-        sphs = np.add.reduceat(sphs, nlist.segments)
-        sphs /= np.clip(neighbor_counts, 1, nNeigh)[:, np.newaxis]
-        result.append(sphs)
+    for (i, nNeigh) in enumerate(range(neigh_min, neigh_max + 1)):
+        # average over the nearest nNeigh neighbors
+        counts = np.minimum(neighbor_counts, nNeigh)
+        averaged = result[:, i*Nsph:(i + 1)*Nsph]
+        np.subtract(bond_sums[nlist.segments + counts], bond_sums[nlist.segments],
+                    out=averaged)
+        averaged /= np.clip(counts, 1, None)[:, np.newaxis]
 
-    return np.hstack(result)
+    return result
 
 
 @cite('freud2016', 'spellings2018')
@@ -108,12 +171,12 @@ def abs_neighbor_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
     :param neigh_max: Maximum number of neighbor environment sizes to consider (inclusive)
     :param lmax: Maximum spherical harmonic degree l
     :param negative_m: Include negative m spherical harmonics in the output array?
-    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate
+    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate. The 'neighborhood' frame is fitted to all bonds of each particle in the neighbor list (its `neigh_max` nearest bonds unless `nlist` is given) and shared by every environment size, so smaller sizes differ from computing them alone.
     :param orientations: Per-particle orientations, only used when reference_frame == 'particle_local'
     :param rmax_guess: Initial guess of the distance to find `neigh_max` nearest neighbors. Only affects algorithm speed.
     :param noise_samples: Number of random noisy samples of positions to average the result over (disabled if 0)
     :param noise_magnitude: Magnitude of (normally-distributed) noise to apply to noise_samples different positions (disabled if `noise_samples == 0`)
-    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`)
+    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`). Each environment size averages over the first bonds of each particle in the list, so it should be sorted by distance.
     """  # noqa E501
     return np.abs(neighbor_average(
         box, positions, neigh_min, neigh_max, lmax, negative_m,
@@ -134,12 +197,12 @@ def system_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
     :param neigh_max: Maximum number of neighbor environment sizes to consider (inclusive)
     :param lmax: Maximum spherical harmonic degree l
     :param negative_m: Include negative m spherical harmonics in the output array?
-    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate
+    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate. The 'neighborhood' frame is fitted to all bonds of each particle in the neighbor list (its `neigh_max` nearest bonds unless `nlist` is given) and shared by every environment size, so smaller sizes differ from computing them alone.
     :param orientations: Per-particle orientations, only used when reference_frame == 'particle_local'
     :param rmax_guess: Initial guess of the distance to find `neigh_max` nearest neighbors. Only affects algorithm speed.
     :param noise_samples: Number of random noisy samples of positions to average the result over (disabled if 0)
     :param noise_magnitude: Magnitude of (normally-distributed) noise to apply to noise_samples different positions (disabled if `noise_samples == 0`)
-    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`)
+    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`). Each environment size averages over the first bonds of each particle in the list, so it should be sorted by distance.
     """  # noqa E501
     return np.mean(neighbor_average(
         box, positions, neigh_min, neigh_max, lmax, negative_m,
@@ -160,12 +223,12 @@ def abs_system_average(box, positions, neigh_min=4, neigh_max=4, lmax=4,
     :param neigh_max: Maximum number of neighbor environment sizes to consider (inclusive)
     :param lmax: Maximum spherical harmonic degree l
     :param negative_m: Include negative m spherical harmonics in the output array?
-    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate
+    :param reference_frame: 'neighborhood': use diagonal inertia tensor reference frame; 'particle_local': use the given orientations array; 'global': do not rotate. The 'neighborhood' frame is fitted to all bonds of each particle in the neighbor list (its `neigh_max` nearest bonds unless `nlist` is given) and shared by every environment size, so smaller sizes differ from computing them alone.
     :param orientations: Per-particle orientations, only used when reference_frame == 'particle_local'
     :param rmax_guess: Initial guess of the distance to find `neigh_max` nearest neighbors. Only affects algorithm speed.
     :param noise_samples: Number of random noisy samples of positions to average the result over (disabled if 0)
     :param noise_magnitude: Magnitude of (normally-distributed) noise to apply to noise_samples different positions (disabled if `noise_samples == 0`)
-    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`)
+    :param nlist: Freud neighbor list object to use (`None` to compute for neighbors up to `neigh_max`). Each environment size averages over the first bonds of each particle in the list, so it should be sorted by distance.
     """  # noqa E501
     return np.abs(system_average(
         box, positions, neigh_min, neigh_max, lmax, negative_m,
@@ -181,37 +244,203 @@ def steinhardt_q(box, positions, neighbors=12, lmax=6, rmax_guess=2.):
     :param lmax: Maximum spherical harmonic degree l
     :param rmax_guess: Initial guess of the distance to find nearest neighbors, if appropriate. Only affects algorithm speed.
     """  # noqa E501
-    box = freud.box.Box.from_box(box)
+    ls = list(range(2, lmax + 1, 2))
+    if not ls:
+        # freud.order.Steinhardt requires at least one l value
+        return np.empty((positions.shape[0], 0), dtype=np.float32)
+
+    box = as_freud_box(box)
     neighbors = _nlist_helper(box, positions, neighbors, rmax_guess)
 
-    result = []
-    for l in range(2, lmax + 1, 2):
-        compute = freud.order.Steinhardt(l)
-        compute.compute((box, positions), neighbors)
-        op = compute.particle_order
-        result.append(op.copy())
+    # compute all l values in a single pass over the neighbor list
+    compute = freud.order.Steinhardt(ls)
+    compute.compute((box, positions), neighbors)
+
+    # particle_order already holds one column per l; copy it so that
+    # callers get a writable array rather than freud's read-only buffer
+    result = np.array(compute.particle_order, dtype=np.float32)
+    return result.reshape((positions.shape[0], len(ls)))
+
+
+def _couplings(lmax):
+    """Iterate over all (l1, l2, l) up to `lmax` satisfying the triangle
+    rule |l1 - l2| <= l <= l1 + l2 (the Clebsch-Gordan coefficients of
+    all others vanish), in sorted order."""
+    for l1 in range(lmax + 1):
+        for l2 in range(lmax + 1):
+            for l in range(abs(l1 - l2), min(lmax, l1 + l2) + 1):  # noqa E741
+                yield (l1, l2, l)
+
+
+@functools.lru_cache(maxsize=None)
+def _cg_table(lmax):
+    """Compute a dense table of Clebsch-Gordan coefficients up to `lmax`.
+
+    Returns `(table, nonzero_mask)`, where `table[l1, l2, l, m1 + lmax,
+    m2 + lmax]` holds the coefficient <l1 m1 l2 m2|l (m1 + m2)>.
+    """
+    sympy = assert_installed('sympy')
+    assert_installed('sympy.physics.wigner')
+
+    table = np.zeros((lmax + 1,)*3 + (2*lmax + 1, 2*lmax + 1))
+    for (l1, l2, l) in _couplings(lmax):
+        for (m1, m2) in itertools.product(range(-l1, l1 + 1), range(-l2, l2 + 1)):
+            if abs(m1 + m2) > l:
+                continue
+            table[l1, l2, l, m1 + lmax, m2 + lmax] = float(
+                sympy.physics.wigner.clebsch_gordan(l1, l2, l, m1, m2, m1 + m2))
+
+    nonzero_mask = table != 0
+    table.flags.writeable = False
+    nonzero_mask.flags.writeable = False
+    return table, nonzero_mask
+
+
+@functools.lru_cache(maxsize=None)
+def _cg_blocks(lmax):
+    """Arrange the Clebsch-Gordan coefficients up to `lmax` into one
+    contraction matrix for each coupling (l1, l2, l).
+
+    Returns a dictionary mapping each (l1, l2, l) with any nonzero
+    coefficient to a `((2*l1 + 1)*(2*l2 + 1), 2*l + 1)` array, where
+    row `(m1 + l1)*(2*l2 + 1) + (m2 + l2)` and column `m1 + m2 + l`
+    holds <l1 m1 l2 m2|l (m1 + m2)>.
+    """
+    table, nonzero_mask = _cg_table(lmax)
+
+    result = {}
+    for (l1, l2, l) in _couplings(lmax):
+        if not np.any(nonzero_mask[l1, l2, l]):
+            continue
+
+        block = np.zeros((2*l1 + 1, 2*l2 + 1, 2*l + 1), dtype=np.float32)
+        for (m1, m2) in itertools.product(range(-l1, l1 + 1), range(-l2, l2 + 1)):
+            if abs(m1 + m2) <= l:
+                block[m1 + l1, m2 + l2, m1 + m2 + l] = table[l1, l2, l, m1 + lmax, m2 + lmax]
+
+        block = block.reshape((-1, 2*l + 1))
+        block.flags.writeable = False
+        result[(l1, l2, l)] = block
 
-    result = np.array(result, dtype=np.float32).T
     return result
 
 
-class _clebsch_gordan_cache(object):
-    _cache = {}
-
-    @classmethod
-    def get(cls, l1, l2, l3, m1, m2, m3):
-        sympy = assert_installed('sympy')
-        assert_installed('sympy.physics.wigner')
-        key = (l1, l2, l3, m1, m2, m3)
-
-        if key not in cls._cache:
-            cls._cache[key] = float(sympy.physics.wigner.clebsch_gordan(*key))
-
-        return cls._cache[key]
+@functools.lru_cache(maxsize=None)
+def _bond_angles_kernel():
+    """Compile (once) a kernel computing the polar angle `phi` and
+    azimuthal angle `theta` of each bond vector, given as separate
+    contiguous x, y, and z component arrays, in a single pass."""
+    numba = assert_installed('numba')
+
+    @numba.njit(parallel=True, fastmath=True)
+    def kernel(xs, ys, zs, phi, theta):
+        for k in numba.prange(xs.shape[0]):
+            x, y, z = xs[k], ys[k], zs[k]
+            # atan2 avoids the division (and loss of precision near
+            # the poles) of acos(z/r)
+            phi[k] = math.atan2(math.sqrt(x*x + y*y), z)
+            theta[k] = math.atan2(y, x)
+
+    return kernel
+
+
+def _sph_column(l, m):  # noqa E741
+    """Column of (l, m) in the spherical harmonic arrays of bispectrum,
+    which follow the ordering of fsph.get_LMs(lmax, negative_m=True):
+    m = 0, 1, ..., l, -1, ..., -l for each l in turn."""
+    return l*l + m if m >= 0 else l*l + l - m
+
+
+@functools.lru_cache(maxsize=None)
+def _legendre_coefficients(lmax):
+    """Coefficients of the recurrences for normalized associated
+    Legendre functions Q_l^m up to `lmax`.
+
+    Returns `(diagonal, a, b)`, where `Q_m^m = diagonal[m] sin(phi)
+    Q_{m-1}^{m-1}` and, for l > m, `Q_l^m = a[l, m] (cos(phi) Q_{l-1}^m -
+    b[l, m] Q_{l-2}^m)`.
+    """
+    diagonal = np.ones(lmax + 1)
+    a = np.zeros((lmax + 1, lmax + 1))
+    b = np.zeros((lmax + 1, lmax + 1))
+
+    for m in range(1, lmax + 1):
+        diagonal[m] = np.sqrt((2*m + 1)/(2*m))
+
+    for (l, m) in itertools.product(range(lmax + 1), range(lmax + 1)):
+        if l > m:
+            a[l, m] = np.sqrt((4*l*l - 1)/(l*l - m*m))
+            b[l, m] = np.sqrt(((l - 1)**2 - m*m)/(4*(l - 1)**2 - 1))
+
+    return diagonal, a, b
+
+
+@functools.lru_cache(maxsize=None)
+def _sph_kernel():
+    """Compile (once) a kernel evaluating the spherical harmonics up to
+    `lmax` of each bond, given its polar angle `phi` and azimuthal angle
+    `theta`, into `out[bond, _sph_column(l, m)]`.
+
+    Matches fsph.pointwise_sph(phi, theta, lmax, negative_m=True): the
+    harmonics are orthonormal, without the Condon-Shortley phase, and
+    Y_l^{-m} is the complex conjugate of Y_l^m.
+    """
+    numba = assert_installed('numba')
+
+    @numba.njit(parallel=True, fastmath=True)
+    def kernel(phi, theta, lmax, diagonal, a, b, out):
+        for k in numba.prange(phi.shape[0]):
+            (cos_phi, sin_phi) = (math.cos(phi[k]), math.sin(phi[k]))
+            (cos_theta, sin_theta) = (math.cos(theta[k]), math.sin(theta[k]))
+
+            # Q_m^m and exp(i m theta), updated as m increases
+            q_mm = 0.5/math.sqrt(math.pi)
+            (cos_mtheta, sin_mtheta) = (1., 0.)
+
+            for m in range(lmax + 1):
+                if m:
+                    q_mm *= diagonal[m]*sin_phi
+                    (cos_mtheta, sin_mtheta) = (
+                        cos_mtheta*cos_theta - sin_mtheta*sin_theta,
+                        sin_mtheta*cos_theta + cos_mtheta*sin_theta)
+
+                # Q_{l-2}^m and Q_{l-1}^m
+                (q_prev, q) = (0., q_mm)
+                for l in range(m, lmax + 1):  # noqa E741
+                    if l > m:
+                        (q_prev, q) = (q, a[l, m]*(cos_phi*q - b[l, m]*q_prev))
+
+                    out[k, l*l + m] = complex(q*cos_mtheta, q*sin_mtheta)
+                    if m:
+                        out[k, l*l + l + m] = complex(q*cos_mtheta, -q*sin_mtheta)
+
+    return kernel
+
+
+@functools.lru_cache(maxsize=None)
+def _segment_mean_kernel():
+    """Compile (once) a kernel averaging rows of `values` over each
+    particle's segment of the neighbor list into the zero-initialized
+    array `out`. Particles without any neighbors are left as 0."""
+    numba = assert_installed('numba')
+
+    @numba.njit(parallel=True, fastmath=True)
+    def kernel(values, segments, counts, out):
+        for i in numba.prange(counts.shape[0]):
+            start = segments[i]
+            for k in range(start, start + counts[i]):
+                for j in range(values.shape[1]):
+                    out[i, j] += values[k, j]
+
+            if counts[i]:
+                for j in range(values.shape[1]):
+                    out[i, j] /= counts[i]
+
+    return kernel
 
 
 @cite('kondor2007', 'freud2016')
-def bispectrum(box, positions, neighbors, lmax, rmax_guess=2.):
+def bispectrum(box, positions, neighbors, lmax, rmax_guess=2., num_threads=None):
     """Computes bispectrum invariants of particle local
     environments. These are rotationally-invariant descriptions
     similar to a power spectrum of the spherical harmonics
@@ -220,57 +449,73 @@ def bispectrum(box, positions, neighbors, lmax, rmax_guess=2.):
 
     :param neighbors: number of nearest-neighbors to consider for local environments
     :param lmax: maximum spherical harmonic degree to consider. O(lmax**3) descriptors will be generated.
+    :param num_threads: maximum number of threads to compute the couplings in (`None` to use all CPUs available to this process, 1 to compute them serially)
     """  # noqa E501
-    fsph = assert_installed('fsph')
-
-    box = freud.box.Box.from_box(box)
+    box = as_freud_box(box)
     nlist = _nlist_helper(box, positions, neighbors, rmax_guess)
 
     rijs = positions[nlist.point_indices] - positions[nlist.query_point_indices]
-    box.wrap(rijs)
-
-    phi = np.arccos(rijs[..., 2]/np.sqrt(np.sum(rijs**2, axis=-1)))
-    theta = np.arctan2(rijs[..., 1], rijs[..., 0])
-
-    sphs = fsph.pointwise_sph(phi, theta, lmax, negative_m=True)
-    sphs = np.add.reduceat(sphs, nlist.segments)/nlist.neighbor_counts[:, np.newaxis]
-    sphs[np.isnan(sphs)] = 0
-    lm_columns = {(l, m): i for (i, (l, m)) in enumerate(fsph.get_LMs(lmax, negative_m=True))}
-
-    for (_, m), i in lm_columns.items():
-        if m > 0 and m % 2:
-            sphs[:, i] *= -1
-
-    result = defaultdict(lambda: 0)
-    for (l1, l2, l) in itertools.product(range(lmax + 1), range(lmax + 1), range(lmax + 1)):
-        result_key = (l1, l2, l)
-
+    rijs = box.wrap(rijs)
+    # split into contiguous per-component arrays for the angle kernel
+    (xs, ys, zs) = np.ascontiguousarray(rijs.T)
+
+    # single precision is sufficient for the descriptors and halves
+    # the memory traffic of the (large) per-bond arrays
+    phi = np.empty(rijs.shape[0], dtype=np.float32)
+    theta = np.empty(rijs.shape[0], dtype=np.float32)
+    _bond_angles_kernel()(xs, ys, zs, phi, theta)
+
+    # bond_sphs::(Nbond, Nsph)
+    bond_sphs = np.empty((rijs.shape[0], (lmax + 1)**2), dtype=np.complex64)
+    _sph_kernel()(phi, theta, lmax, *_legendre_coefficients(lmax), bond_sphs)
+    # sphs::(Nparticles, Nsph), averaged over neighbors
+    sphs = np.zeros((positions.shape[0], bond_sphs.shape[1]), dtype=bond_sphs.dtype)
+    _segment_mean_kernel()(bond_sphs, nlist.segments, nlist.neighbor_counts, sphs)
+    # particles without neighbors are already left at 0 by the kernel
+    # and atan2 handles zero-length bonds, so NaN can only come from
+    # non-finite positions; zero it, but leave infinities untouched
+    np.nan_to_num(sphs, copy=False, nan=0, posinf=np.inf, neginf=-np.inf)
+
+    # lm_index[l, m + lmax] is the column of sphs holding (l, m), or -1
+    lm_index = np.full((lmax + 1, 2*lmax + 1), -1, dtype=np.int32)
+    for l in range(lmax + 1):  # noqa E741
         for m in range(-l, l + 1):
-            left = sphs[:, lm_columns[(l, m)]]
-
-            right = 0 + 0j
-
-            nonzero = False
-            m1_min = max(-l1, m - l2)
-            m1_max = min(l1, m + l2)
-            for m1 in range(m1_min, m1_max + 1):
-                term = _clebsch_gordan_cache.get(l1, l2, l, m1, m - m1, m)
-
-                if term == 0:
-                    continue
-                else:
-                    nonzero = True
-
-                term *= np.conj(sphs[:, lm_columns[(l1, m1)]])
-                term *= np.conj(sphs[:, lm_columns[(l2, m - m1)]])
-
-                right += term
-
-            if nonzero:
-                result[result_key] += left*right
-
-    result_columns = [result[key] for key in sorted(result)]
-    result = np.array(result_columns, dtype=np.complex128).T
-    result = np.ascontiguousarray(result).view(np.float64).reshape((positions.shape[0], -1))
+            lm_index[l, m + lmax] = _sph_column(l, m)
+
+    # flip the sign of the positive, odd m harmonics
+    odd_columns = lm_index[:, lmax + 1::2]
+    sphs[:, odd_columns[odd_columns >= 0]] *= -1
+
+    # sphs_l[l]::(Nparticles, 2*l + 1), ordered by m = -l, ..., l
+    sphs_l = [sphs[:, lm_index[l, lmax - l:lmax + l + 1]]
+              for l in range(lmax + 1)]  # noqa E741
+    # conjugated once here rather than for every coupling using them
+    conj_sphs_l = [np.conj(sph_l) for sph_l in sphs_l]
+
+    # couplings are ordered by (l1, l2, l); result[:, 2*i] and
+    # result[:, 2*i + 1] hold the real and imaginary parts of the
+    # invariant of the i-th coupling
+    couplings = _cg_blocks(lmax)
+    result = np.empty((positions.shape[0], 2*len(couplings)), dtype=np.float64)
+
+    def compute_coupling(i, coupling):
+        (l1, l2, l) = coupling
+        cg_block = couplings[coupling]
+
+        # right[:, m + l] = sum_{m1} <l1 m1 l2 (m - m1)|l m> Y*_{l1 m1} Y*_{l2 (m - m1)}
+        products = conj_sphs_l[l1][:, :, np.newaxis]*conj_sphs_l[l2][:, np.newaxis, :]
+        right = products.reshape((positions.shape[0], -1)).dot(cg_block)
+
+        # sum_m Y_{l m} right[:, m + l] without an (Nparticles, 2*l + 1) temporary
+        invariant = np.einsum('pm,pm->p', sphs_l[l], right)
+        result[:, 2*i] = invariant.real
+        result[:, 2*i + 1] = invariant.imag
+
+    # couplings write to disjoint columns and numpy releases the GIL
+    # for the heavy lifting, so they can be computed in threads
+    max_workers = _max_workers(len(couplings), num_threads)
+    with _parallel_map(concurrent.futures.ThreadPoolExecutor, max_workers) as map_couplings:
+        # consume the results so that any exceptions are raised
+        list(map_couplings(compute_coupling, range(len(couplings)), couplings))
 
     return result
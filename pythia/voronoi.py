@@ -9,7 +9,7 @@ import freud
 import scipy as sp
 import scipy.spatial
 
-from .internal import cite
+from .internal import as_freud_box, cite
 
 
 def _angle_histogram_3d(vertices, bins=16, area_weight_mode='product'):
@@ -71,7 +71,7 @@ def angle_histogram(box, positions, bins, buffer_distance=None, area_weight_mode
     if buffer_distance is None:
         buffer_distance = max(box.Lx, box.Ly, box.Lz)
 
-    fbox = freud.box.Box.from_box(box)
+    fbox = as_freud_box(box)
     voronoi = freud.locality.Voronoi()
     voronoi.compute((fbox, positions))
 
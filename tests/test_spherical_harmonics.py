@@ -0,0 +1,198 @@
+import numpy as np
+import freud
+import pythia
+import unittest
+import unittest.mock
+
+
+class TestSphericalHarmonics(unittest.TestCase):
+    @staticmethod
+    def _nearest_neighbors(box, positions, num_neighbors):
+        query = freud.AABBQuery(box, positions).query(
+            positions, {'num_neighbors': num_neighbors, 'exclude_ii': True})
+        return query.toNeighborList(sort_by_distance=True)
+
+    def test_cg_table(self):
+        lmax = 2
+        table, nonzero = pythia.spherical_harmonics._cg_table(lmax)
+
+        self.assertEqual(table.shape, (3, 3, 3, 5, 5))
+        np.testing.assert_array_equal(nonzero, table != 0)
+
+        # <1 1 1 -1|0 0> = 1/sqrt(3)
+        self.assertAlmostEqual(table[1, 1, 0, 1 + lmax, -1 + lmax], 1/np.sqrt(3))
+        # <1 0 1 0|1 0> = 0
+        self.assertEqual(table[1, 1, 1, lmax, lmax], 0)
+        # <2 2 1 -1|2 1> = sqrt(1/3)
+        self.assertAlmostEqual(table[2, 1, 2, 2 + lmax, -1 + lmax], np.sqrt(1/3))
+        # triangle rule: l1 + l2 < l
+        self.assertFalse(np.any(nonzero[0, 1, 2]))
+
+    def test_sph_kernel(self):
+        lmax = 2
+        sh = pythia.spherical_harmonics
+
+        np.random.seed(0)
+        phi = np.random.uniform(0, np.pi, 100).astype(np.float32)
+        theta = np.random.uniform(-np.pi, np.pi, 100).astype(np.float32)
+
+        sphs = np.empty((len(phi), (lmax + 1)**2), dtype=np.complex64)
+        sh._sph_kernel()(phi, theta, lmax, *sh._legendre_coefficients(lmax), sphs)
+
+        (phi, theta) = (phi.astype(np.float64), theta.astype(np.float64))
+        expected = {
+            (0, 0): np.full_like(phi, 0.5/np.sqrt(np.pi)),
+            (1, 0): np.sqrt(3/4/np.pi)*np.cos(phi),
+            (1, 1): np.sqrt(3/8/np.pi)*np.sin(phi)*np.exp(1j*theta),
+            (2, 0): np.sqrt(5/16/np.pi)*(3*np.cos(phi)**2 - 1),
+            (2, 1): np.sqrt(15/8/np.pi)*np.sin(phi)*np.cos(phi)*np.exp(1j*theta),
+            (2, 2): np.sqrt(15/32/np.pi)*np.sin(phi)**2*np.exp(2j*theta),
+        }
+
+        for ((l, m), value) in expected.items():
+            np.testing.assert_allclose(sphs[:, sh._sph_column(l, m)], value, atol=1e-6)
+            np.testing.assert_allclose(sphs[:, sh._sph_column(l, -m)], np.conj(value), atol=1e-6)
+
+    def test_neighbor_average_sizes(self):
+        N = 500
+        lmax = 4
+        Nsph = (lmax + 1)**2
+
+        box = freud.box.Box.cube(10)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+
+        descriptors = pythia.spherical_harmonics.neighbor_average(
+            box, positions, neigh_min=4, neigh_max=6, lmax=lmax,
+            reference_frame='global')
+        self.assertEqual(descriptors.shape, (N, 3*Nsph))
+
+        # each block should match a single environment size computed alone
+        for (i, nNeigh) in enumerate(range(4, 7)):
+            single = pythia.spherical_harmonics.neighbor_average(
+                box, positions, neigh_min=nNeigh, neigh_max=nNeigh, lmax=lmax,
+                reference_frame='global')
+            np.testing.assert_allclose(
+                descriptors[:, i*Nsph:(i + 1)*Nsph], single, atol=1e-5)
+
+    def test_bispectrum_translation(self):
+        N = 200
+        lmax = 4
+
+        box = freud.box.Box.cube(6)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+
+        # a periodic translation of the whole system should not change
+        # any environment, even for bonds crossing the boundary
+        shifted = box.wrap(positions + np.float32(1.7))
+
+        descriptors = pythia.spherical_harmonics.bispectrum(
+            box, positions, self._nearest_neighbors(box, positions, 12), lmax)
+        shifted_descriptors = pythia.spherical_harmonics.bispectrum(
+            box, shifted, self._nearest_neighbors(box, shifted, 12), lmax)
+        np.testing.assert_allclose(descriptors, shifted_descriptors, atol=1e-4)
+
+    def test_steinhardt_q_shape(self):
+        N = 100
+
+        box = freud.box.Box.cube(6)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+        nlist = self._nearest_neighbors(box, positions, 12)
+
+        for (lmax, expected) in [(6, 3), (3, 1), (1, 0)]:
+            result = pythia.spherical_harmonics.steinhardt_q(box, positions, nlist, lmax)
+            self.assertEqual(result.shape, (N, expected))
+
+    def test_steinhardt_q_writable(self):
+        N = 100
+
+        box = freud.box.Box.cube(6)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+        nlist = self._nearest_neighbors(box, positions, 12)
+
+        result = pythia.spherical_harmonics.steinhardt_q(box, positions, nlist, 6)
+        expected = result.copy()
+        result -= 1
+        np.testing.assert_allclose(result, expected - 1)
+
+    def test_bispectrum_rotation(self):
+        N = 100
+        lmax = 4
+
+        # an isolated cluster in a large box, so that no bonds cross the
+        # periodic boundary after rotating it
+        box = freud.box.Box.cube(20)
+        np.random.seed(0)
+        positions = np.random.uniform(-2, 2, size=(N, 3)).astype(np.float32)
+
+        (rotation, _) = np.linalg.qr(np.random.normal(size=(3, 3)))
+        rotated = positions.dot(rotation.T).astype(np.float32)
+
+        nlist = self._nearest_neighbors(box, positions, 12)
+        descriptors = pythia.spherical_harmonics.bispectrum(box, positions, nlist, lmax)
+        rotated_descriptors = pythia.spherical_harmonics.bispectrum(box, rotated, nlist, lmax)
+
+        # one (real, imaginary) pair per coupling (l1, l2, l) allowed by
+        # the triangle rule
+        num_couplings = sum(
+            1 for l1 in range(lmax + 1) for l2 in range(lmax + 1)
+            for l in range(abs(l1 - l2), min(l1 + l2, lmax) + 1))  # noqa E741
+        self.assertEqual(num_couplings, 65)
+        self.assertEqual(descriptors.shape, (N, 2*num_couplings))
+        np.testing.assert_allclose(descriptors, rotated_descriptors, rtol=1e-3, atol=1e-6)
+
+    def test_bispectrum_threads(self):
+        N = 100
+        lmax = 4
+
+        box = freud.box.Box.cube(6)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+        nlist = self._nearest_neighbors(box, positions, 12)
+
+        serial = pythia.spherical_harmonics.bispectrum(
+            box, positions, nlist, lmax, num_threads=1)
+        threaded = pythia.spherical_harmonics.bispectrum(
+            box, positions, nlist, lmax, num_threads=4)
+        np.testing.assert_array_equal(serial, threaded)
+
+    def test_neighbor_average_noise(self):
+        N = 200
+        lmax = 4
+        sh = pythia.spherical_harmonics
+
+        box = freud.box.Box.cube(6)
+        np.random.seed(0)
+        positions = np.random.uniform(-box.Lx/2, box.Lx/2,
+                                      size=(N, 3)).astype(np.float32)
+
+        def compute():
+            np.random.seed(1)
+            return sh.neighbor_average(
+                box, positions, lmax=lmax, reference_frame='global',
+                noise_samples=4, noise_magnitude=0.05)
+
+        serial = compute()
+        # reproducible with np.random.seed
+        np.testing.assert_array_equal(serial, compute())
+
+        # the noise should actually change the descriptors
+        noiseless = sh.neighbor_average(box, positions, lmax=lmax, reference_frame='global')
+        self.assertGreater(np.max(np.abs(serial - noiseless)), 1e-3)
+
+        # samples computed in several threads should give the same
+        # result as computing them serially
+        with unittest.mock.patch.object(sh, '_max_workers', return_value=4):
+            np.testing.assert_allclose(compute(), serial, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()